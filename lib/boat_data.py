@@ -1,6 +1,7 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 
-from numpy import datetime64
+from numpy import datetime64, float64, ndarray, zeros
+from pandas import DataFrame
 
 from strictly_typed_pandas.dataset import DataSet
 
@@ -32,3 +33,49 @@ class BoatOutputData:
 
 
 BoatOutputDataSet = DataSet[BoatOutputData]
+
+
+@dataclass
+class BoatOutputArrays:
+    """Structure of arrays version of BoatOutputData, holding one element per
+    timestep."""
+
+    pv_output_power: ndarray
+    battery_stored_energy: ndarray
+    battery_soc: ndarray
+    battery_output_power: ndarray
+    esc_input_power: ndarray
+    esc_output_power: ndarray
+    motor_output_power: ndarray
+    propulsive_output_power: ndarray
+    hull_speed: ndarray
+    pv_target_power: ndarray
+    esc_target_power: ndarray
+    battery_target_power: ndarray
+    motor_target_throttle: ndarray
+
+    @staticmethod
+    def zeros(size: int, dtype: type = float64) -> "BoatOutputArrays":
+        return BoatOutputArrays(
+            *(zeros(size, dtype=dtype) for _ in fields(BoatOutputArrays))
+        )
+
+    def __setitem__(self, k: int, data: BoatOutputData) -> None:
+        self.pv_output_power[k] = data.pv_output_power
+        self.battery_stored_energy[k] = data.battery_stored_energy
+        self.battery_soc[k] = data.battery_soc
+        self.battery_output_power[k] = data.battery_output_power
+        self.esc_input_power[k] = data.esc_input_power
+        self.esc_output_power[k] = data.esc_output_power
+        self.motor_output_power[k] = data.motor_output_power
+        self.propulsive_output_power[k] = data.propulsive_output_power
+        self.hull_speed[k] = data.hull_speed
+        self.pv_target_power[k] = data.pv_target_power
+        self.esc_target_power[k] = data.esc_target_power
+        self.battery_target_power[k] = data.battery_target_power
+        self.motor_target_throttle[k] = data.motor_target_throttle
+
+    def to_dataset(self) -> BoatOutputDataSet:
+        return DataFrame(
+            {f.name: getattr(self, f.name) for f in fields(BoatOutputArrays)}
+        ).pipe(BoatOutputDataSet)
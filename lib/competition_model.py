@@ -1,10 +1,10 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typeguard import typechecked
 
-from numpy import datetime64
+from numpy import broadcast_to, datetime64, diff, ndarray, timedelta64
 from pandas import Timestamp
 
-from lib.boat_data import BoatInputDataSet
+from lib.boat_data import BoatInputDataSet, BoatOutputArrays
 from lib.event_model import EventOutputData
 
 
@@ -22,6 +22,9 @@ class Competition:
 
     name: str
     events: list[Event]
+    _input_cache: dict = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     @typechecked
     def run(
@@ -30,33 +33,24 @@ class Competition:
         boat: Boat,
         energy_controller: EnergyController,
     ) -> CompetitionResult:
-        competition_start: datetime64 = Timestamp(
-            self.events[0].data.start
-        ).to_datetime64()
-        competition_end: datetime64 = Timestamp(
-            self.events[-1].data.end
-        ).to_datetime64()
-
-        self._check_input(input_data, competition_start, competition_end)
+        event_bounds = self._event_bounds()
+        competition_start: datetime64 = event_bounds[0][0]
+        competition_end: datetime64 = event_bounds[-1][1]
 
         # Select the competition simulation input data
-        input_data = input_data[
-            (input_data.time >= competition_start)
-            & (input_data.time <= competition_end)
-        ].pipe(BoatInputDataSet)
+        _, times, poa = self._select_input(
+            input_data, competition_start, competition_end
+        )
 
         results: list[EventOutputData] = []
 
-        for event in self.events:
+        for event, (event_start, event_end) in zip(self.events, event_bounds):
             # Select the event simulation input data
-            event_start: datetime64 = Timestamp(event.data.start).to_datetime64()
-            event_end: datetime64 = Timestamp(event.data.end).to_datetime64()
-            event_input_data = input_data[
-                (input_data.time >= event_start) & (input_data.time <= event_end)
-            ].pipe(BoatInputDataSet)
+            event_slice = self._time_slice(times, event_start, event_end)
             results.append(
-                event.run(
-                    boat_input_data=event_input_data,
+                event.run_arrays(
+                    time=times[event_slice],
+                    poa=poa[event_slice],
                     boat=boat,
                     energy_controller=energy_controller,
                 )
@@ -64,6 +58,134 @@ class Competition:
 
         return CompetitionResult(name=self.name, results=results)
 
+    @typechecked
+    def sweep(
+        self,
+        input_data: BoatInputDataSet,
+        boats: list[Boat],
+        motor_throttle: ndarray,
+    ) -> list[list[BoatOutputArrays]]:
+        """Simulates independent boats through every event, in parallel, following a
+        known `motor_throttle` series instead of an energy controller.
+
+        `motor_throttle` is aligned with `input_data`, either shared by all boats, with
+        shape (len(input_data),), or given per boat, with shape
+        (len(boats), len(input_data)). The input data must be evenly spaced in time
+        within each event. The outputs are indexed as [event][boat]."""
+        if motor_throttle.ndim not in (1, 2):
+            raise ValueError(
+                "motor_throttle must have either 1 or 2 dimensions, "
+                + f"got shape {motor_throttle.shape}"
+            )
+        if motor_throttle.shape[-1] != len(input_data):
+            raise ValueError(
+                "motor_throttle must be aligned with the given data: "
+                + f"{motor_throttle.shape[-1]} != {len(input_data)}"
+            )
+        if motor_throttle.ndim == 2 and motor_throttle.shape[0] != len(boats):
+            raise ValueError(
+                "motor_throttle must have one series per boat: "
+                + f"{motor_throttle.shape[0]} != {len(boats)}"
+            )
+
+        event_bounds = self._event_bounds()
+        competition_slice, times, irradiation = self._select_input(
+            input_data, event_bounds[0][0], event_bounds[-1][1]
+        )
+        motor_throttle = broadcast_to(motor_throttle, (len(boats), len(input_data)))
+        motor_throttle = motor_throttle[:, competition_slice]
+
+        results: list[list[BoatOutputArrays]] = []
+
+        for event_start, event_end in event_bounds:
+            event_slice = self._time_slice(times, event_start, event_end)
+
+            # A single dt is used for each event, as in `Boat.run_series`, so gaps
+            # between the events, like nights, are allowed.
+            time_steps = diff(times[event_slice])
+            if time_steps.size == 0 or (time_steps != time_steps[0]).any():
+                raise ValueError(
+                    "Given data must have at least 2 evenly spaced samples within"
+                    + f" each event to be swept, from {event_start} to {event_end}"
+                )
+            dt = float(time_steps[0] / timedelta64(1, "s"))
+
+            results.append(
+                self.Boat.run_many(
+                    boats,
+                    dt,
+                    irradiation[event_slice],
+                    motor_throttle[:, event_slice],
+                )
+            )
+
+        return results
+
+    def _select_input(
+        self,
+        input_data: BoatInputDataSet,
+        competition_start: datetime64,
+        competition_end: datetime64,
+    ) -> tuple[slice, ndarray, ndarray]:
+        """Competition window of the input data, as its slice plus the time and poa
+        arrays within it. The last selection is cached, so repeated runs over the same
+        input data skip both the checks and the slicing. The input data are assumed not
+        to be modified in place between runs."""
+        key = (id(input_data), competition_start, competition_end)
+        if key not in self._input_cache:
+            self._check_input(input_data, competition_start, competition_end)
+
+            times = input_data.time.values
+            competition_slice = self._time_slice(
+                times, competition_start, competition_end
+            )
+            # Keeping a reference to the input data keeps its id from being reused while
+            # it is cached; caching only the last selection invalidates it on new input.
+            self._input_cache = {
+                key: (
+                    input_data,
+                    competition_slice,
+                    times[competition_slice],
+                    input_data.poa.values[competition_slice],
+                )
+            }
+
+        _, competition_slice, times, poa = self._input_cache[key]
+        return competition_slice, times, poa
+
+    def _event_bounds(self) -> list[tuple[datetime64, datetime64]]:
+        """Start and end of each event, which must be in chronological order and
+        not overlap, as the competition window goes from the first event's start to
+        the last event's end and the boat goes through them in sequence."""
+        event_bounds: list[tuple[datetime64, datetime64]] = [
+            (
+                Timestamp(event.data.start).to_datetime64(),
+                Timestamp(event.data.end).to_datetime64(),
+            )
+            for event in self.events
+        ]
+
+        previous_end = None
+        for event, (event_start, event_end) in zip(self.events, event_bounds):
+            if event_end < event_start:
+                raise ValueError(f"Event {event.data.name} can't end before its start")
+            if previous_end is not None and event_start < previous_end:
+                raise ValueError(
+                    f"Event {event.data.name} can't start before the previous event's"
+                    + " end, events must be in chronological order"
+                )
+            previous_end = event_end
+
+        return event_bounds
+
+    @staticmethod
+    def _time_slice(times: ndarray, start: datetime64, end: datetime64) -> slice:
+        """Slice of the sorted `times` array that lies within [start, end]."""
+        return slice(
+            times.searchsorted(start, side="left"),
+            times.searchsorted(end, side="right"),
+        )
+
     @typechecked
     def _check_input(
         self,
@@ -71,9 +193,17 @@ class Competition:
         competition_start: datetime64,
         competition_end: datetime64,
     ):
-        if input_data.iloc[0].time > competition_start:
-            print(input_data.iloc[0].time, competition_start)
-            raise ValueError("Given data can't start after the first event's start")
-        if input_data.iloc[-1].time < competition_end:
-            print(input_data.iloc[-1].time, competition_end)
-            raise ValueError("Given data can't end before the first event's end.")
+        times = input_data.time.values
+        # The competition and event windows are found by binary search.
+        if not (times[1:] >= times[:-1]).all():
+            raise ValueError("Given data must be sorted by time")
+        if times[0] > competition_start:
+            raise ValueError(
+                "Given data can't start after the first event's start: "
+                + f"{times[0]} > {competition_start}"
+            )
+        if times[-1] < competition_end:
+            raise ValueError(
+                "Given data can't end before the last event's end: "
+                + f"{times[-1]} < {competition_end}"
+            )
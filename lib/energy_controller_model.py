@@ -1,5 +1,4 @@
 from abc import ABC, abstractmethod
-from typeguard import typechecked
 
 from lib.boat_model import Boat
 from lib.boat_data import BoatInputData, BoatOutputData
@@ -7,7 +6,6 @@ from lib.event_model import EventInputData, EventResultData, RaceStatus
 
 
 class EnergyController(ABC):
-    @typechecked
     @abstractmethod
     def run(
         self,
@@ -4,14 +4,14 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typeguard import typechecked
 
-from numpy import int64
-from pandas import DataFrame, Timestamp, Timedelta
+from pandas import DataFrame, DatetimeIndex, Timestamp, Timedelta
 from strictly_typed_pandas.dataset import DataSet
 
 
 from lib.boat_data import (
     BoatInputData,
     BoatInputDataSet,
+    BoatOutputArrays,
     BoatOutputData,
     BoatOutputDataSet,
 )
@@ -84,7 +84,6 @@ class FixedLapsGoal(EventGoal):
     total_time: Timedelta
     _completed_laps: int = 0
 
-    @typechecked
     def accomplished(self, event_result: EventResultData) -> bool:
         self._completed_laps = int(event_result.distance // self.lap_distance)
 
@@ -123,16 +122,33 @@ class Event:
         boat: Boat,
         energy_controller: EnergyController,
     ) -> EventOutputData:
-        # Transform time vector to seconds
-        t = boat_input_data.time.to_numpy().astype(int64)
-        t = (t - t[0]) * 1e-9
-
-        output_data = np.full(
-            shape=t.size,
-            fill_value=BoatOutputData(0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
-            dtype=BoatOutputData,
+        return self.run_arrays(
+            time=boat_input_data.time.to_numpy(),
+            poa=boat_input_data.poa.to_numpy(),
+            boat=boat,
+            energy_controller=energy_controller,
         )
 
+    @typechecked
+    def run_arrays(
+        self,
+        time: np.ndarray,
+        poa: np.ndarray,
+        boat: Boat,
+        energy_controller: EnergyController,
+    ) -> EventOutputData:
+        """Same as `run`, but taking the boat input data as raw `time` (datetime64) and
+        `poa` arrays, which are only wrapped into a BoatInputDataSet for the output.
+        It still steps through the event, as the energy controller closes the loop."""
+        # Transform time vector to seconds, whatever the datetime64 unit is
+        t = (time - time[0]) / np.timedelta64(1, "s")
+        # The energy controller gets each time as a Timestamp, as from the DataSet rows
+        timestamps = list(DatetimeIndex(time))
+
+        output_data = BoatOutputArrays.zeros(t.size)
+        empty_boat_output = BoatOutputData(0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+        previous_boat_output = empty_boat_output
+
         event_result = np.full(
             shape=t.size,
             fill_value=EventResultData(
@@ -141,29 +157,32 @@ class Event:
             dtype=EventResultData,
         )
 
-        dt: int64 = t[1] - t[0]
+        goal = self.data.goal
+
+        dt: float = float(t[1] - t[0])
         for k in range(t.size):
             k_old = max(0, k - 1)
 
             if k > 0:
-                dt = t[k] - t[k_old]
+                dt = float(t[k] - t[k_old])
+
+            boat_input = BoatInputData(time=timestamps[k], poa=float(poa[k]))
 
             status = RaceStatus.DNS
+            boat_output = empty_boat_output
             try:
                 control = energy_controller.run(
-                    dt=float(dt),
-                    input_data=BoatInputData(**boat_input_data.iloc[k].to_dict()),
-                    output_data=output_data[k_old],
+                    dt=dt,
+                    input_data=boat_input,
+                    output_data=previous_boat_output,
                     event_result=event_result[k_old],
                     boat=boat,
                     event=self.data,
                 )
 
-                output_data[k] = boat.run(
-                    float(dt), boat_input_data.iloc[k].poa, control
-                )
+                boat_output = boat.run(dt, boat_input.poa, control)
 
-                if self.data.goal.accomplished(event_result=event_result[k_old]):
+                if goal.accomplished(event_result=event_result[k_old]):
                     status = RaceStatus.FINISHED
                 else:
                     status = RaceStatus.STARTED
@@ -177,10 +196,11 @@ class Event:
                         + f" => {RaceStatus.to_str(status)}. Reason: {e}"
                     )
 
-            distance = output_data[k].hull_speed * dt
-            elapsed_time = Timedelta(
-                boat_input_data.iloc[k].time - boat_input_data.iloc[0].time
-            ).to_timedelta64()
+            output_data[k] = boat_output
+            previous_boat_output = boat_output
+
+            distance = boat_output.hull_speed * dt
+            elapsed_time = time[k] - time[0]
 
             event_result[k] = EventResultData(
                 distance=event_result[k_old].distance + distance,
@@ -188,17 +208,18 @@ class Event:
                 status=status,
             )
 
-        output_data = DataFrame(list(output_data)).pipe(BoatOutputDataSet)
-
         event_result = DataFrame(
             list(
                 event_result,
             )
         ).pipe(EventResultDataSet)
 
+        # Slicing a DataSet gives back a plain DataFrame, so the event input has to be
+        # wrapped (and so validated) again anyway. That is done once per event from the
+        # arrays, instead of once per timestep as in the loop before.
         return EventOutputData(
             name=self.data.name,
-            input_data=boat_input_data,
-            output_data=output_data,
+            input_data=BoatInputDataSet({"time": time, "poa": poa}),
+            output_data=output_data.to_dataset(),
             event_result=event_result,
         )